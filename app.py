@@ -7,9 +7,14 @@ Based on the user's uploaded app.py. fileciteturn1file0
 import logging
 import time
 import html
+import hashlib
+import re
+import queue
+import threading
 import traceback
 
 import gradio as gr
+import numpy as np
 
 import os
 os.environ['PYTORCH_CUDA_ALLOC_CONF'] = 'max_split_size_mb:128'
@@ -19,63 +24,225 @@ from utils.audio_utils import AudioHandler
 from utils.voice_config import VoiceConfig
 from models.enhanced_interview_model import EnhancedInterviewModel
 
-# Optional semantic/fuzzy scoring libs (lazy loaded)
+# Optional semantic/fuzzy scoring libs (imported on first use: sentence-transformers
+# pulls in torch + transformers, which costs seconds of startup)
 _semantic_model = None
-_have_rapidfuzz = False
-try:
-    from sentence_transformers import SentenceTransformer, util as st_util
-    _have_sentence_transformers = True
-except Exception:
-    _have_sentence_transformers = False
-    try:
-        from rapidfuzz import fuzz
-        _have_rapidfuzz = True
-    except Exception:
-        _have_rapidfuzz = False
+_semantic_model_lock = threading.Lock()
+_have_sentence_transformers = None   # unknown until first import attempt
+_fuzz = None
+_have_rapidfuzz = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("voice_interview")
 
-def get_semantic_model():
-    """Lazy-load the sentence-transformers model if available."""
-    global _semantic_model
-    if not _have_sentence_transformers:
+# canonical-answer embeddings, keyed by a hash of the answer text
+_answer_emb_cache = {}
+
+def _answer_key(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+# Semantic cache of already-scored user answers, one ring buffer per canonical answer.
+# Repeat / near-identical answers ("I don't know", textbook definitions) reuse the score.
+_ANSWER_CACHE_SIZE = 1024
+_ANSWER_CACHE_THRESHOLD = 0.97
+_answer_score_cache = {}
+
+class _AnswerScoreCache:
+    """Ring buffer of (user answer embedding -> score) for one canonical answer."""
+
+    def __init__(self, dim: int):
+        self.embs = np.empty((16, dim), dtype=np.float32)   # grows up to _ANSWER_CACHE_SIZE
+        self.scores = []         # slot -> score, kept as Python floats so repeats return it exactly
+        self.texts = []          # slot -> normalized user text
+        self.by_text = {}        # normalized user text -> slot
+        self.pos = 0
+
+    def get_text(self, text: str):
+        slot = self.by_text.get(text)
+        return None if slot is None else self.scores[slot]
+
+    def get_similar(self, emb):
+        n = len(self.texts)
+        if not n:
+            return None
+        sims = self.embs[:n] @ emb
+        best = int(np.argmax(sims))
+        return self.scores[best] if sims[best] >= _ANSWER_CACHE_THRESHOLD else None
+
+    def add(self, text: str, emb, score: float):
+        n = len(self.texts)
+        if n < _ANSWER_CACHE_SIZE:
+            if n == len(self.embs):
+                cap = min(2 * n, _ANSWER_CACHE_SIZE)
+                self.embs = np.resize(self.embs, (cap, self.embs.shape[1]))
+            slot = n
+            self.texts.append(text)
+            self.scores.append(score)
+        else:
+            # full: overwrite the oldest entry
+            slot = self.pos
+            self.pos = (self.pos + 1) % _ANSWER_CACHE_SIZE
+            self.by_text.pop(self.texts[slot], None)
+            self.texts[slot] = text
+            self.scores[slot] = score
+        self.embs[slot] = emb
+        self.by_text[text] = slot
+
+def _load_onnx_semantic_model():
+    """Quantized ONNX Runtime MiniLM for CPU hosts, or None if optimum/onnxruntime is unavailable."""
+    try:
+        from utils.onnx_encoder import load_quantized_minilm
+        model = load_quantized_minilm(os.environ.get('TRANSFORMERS_CACHE', '/tmp/transformers_cache'))
+        return model
+    except Exception as e:
+        logger.info("ONNX Runtime semantic model unavailable (%s); using PyTorch.", e)
         return None
-    if _semantic_model is None:
+
+def get_semantic_model():
+    """Lazy-load the sentence-transformers model if available (thread-safe)."""
+    global _semantic_model, _have_sentence_transformers
+    if _semantic_model is not None or _have_sentence_transformers is False:
+        return _semantic_model
+    # may be called concurrently by the warm-up thread and the interview loop
+    with _semantic_model_lock:
+        if _semantic_model is not None or _have_sentence_transformers is False:
+            return _semantic_model
         try:
-            # small model that is fast and effective
-            _semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Loaded sentence-transformers 'all-MiniLM-L6-v2' for semantic scoring.")
+            import torch
+            from sentence_transformers import SentenceTransformer
+            _have_sentence_transformers = True
+        except Exception:
+            _have_sentence_transformers = False
+            return None
+        try:
+            # small model that is fast and effective; fp16 on GPU when available,
+            # int8 ONNX Runtime on CPU when optimum is installed
+            if torch.cuda.is_available():
+                _semantic_model = SentenceTransformer('all-MiniLM-L6-v2', device="cuda").half()
+                backend = "PyTorch fp16 (CUDA)"
+            else:
+                _semantic_model = _load_onnx_semantic_model()
+                backend = "ONNX Runtime int8 (CPU)"
+                if _semantic_model is None:
+                    _semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
+                    backend = "PyTorch fp32 (CPU)"
+            # spoken answers and DB answers are short; cap padded length
+            _semantic_model.max_seq_length = 128
+            # backends score slightly differently, so say which one is in use
+            logger.info("Loaded 'all-MiniLM-L6-v2' for semantic scoring: %s backend.", backend)
         except Exception as e:
             logger.warning("Failed to load sentence-transformers model: %s", e)
             _semantic_model = None
     return _semantic_model
 
-def semantic_score(correct: str, user: str) -> float:
+def encode_normalized(model, texts, **kwargs):
+    """Unit-norm numpy embeddings from `model.encode`, run under torch.inference_mode()."""
+    import torch
+    # inference_mode also skips autograd version-counter bookkeeping that no_grad keeps
+    with torch.inference_mode():
+        return model.encode(texts, convert_to_numpy=True, normalize_embeddings=True, **kwargs)
+
+def prewarm_semantic_model():
+    """Load the semantic model and run one dummy encode (first forward allocates kernels/workspaces)."""
+    model = get_semantic_model()
+    if model:
+        try:
+            encode_normalized(model, "warmup")
+        except Exception as e:
+            logger.warning("semantic model warm-up failed: %s", e)
+
+def get_fuzz():
+    """Lazy-import rapidfuzz.fuzz if available."""
+    global _fuzz, _have_rapidfuzz
+    if _have_rapidfuzz is None:
+        try:
+            from rapidfuzz import fuzz
+            _fuzz, _have_rapidfuzz = fuzz, True
+        except Exception:
+            _have_rapidfuzz = False
+    return _fuzz
+
+def similarity_to_score(sim: float) -> float:
+    """Map cosine similarity (-1..1) to a 0..10 score."""
+    sim = max(0.0, sim)  # clamp negatives
+    # Map similarity to 0..10 (tuneable)
+    # sim ~ 0.0 -> 0, sim ~0.6 -> ~7, sim ~0.8 -> ~9
+    return round(min(10.0, (sim ** 1.1) * 11.0), 1)
+
+def _trivial_score(c_lo: str, u_lo: str):
+    """Score for cases that need no model (verbatim / too-short answer), else None."""
+    if u_lo == c_lo:
+        return 10.0
+    # absolute floor: concise answers to long canonical answers still get scored
+    if len(u_lo) < 3:
+        return 0.0
+    return None
+
+def _score_embeddings(key: str, user_key: str, emb_c, emb_u) -> float:
+    """Score a (canonical, user) embedding pair through the semantic answer cache."""
+    cache = _answer_score_cache.get(key)
+    # near-duplicate of an already-scored answer: reuse its score
+    if cache is not None:
+        cached = cache.get_similar(emb_u.astype(np.float32, copy=False))
+        if cached is not None:
+            return cached
+
+    # both embeddings are unit-norm, so the dot product is the cosine;
+    # numpy on host avoids a tensor .item() device sync
+    score = similarity_to_score(float(np.dot(emb_c, emb_u)))
+
+    if cache is None:
+        cache = _answer_score_cache[key] = _AnswerScoreCache(emb_u.shape[-1])
+    cache.add(user_key, emb_u, score)
+    return score
+
+def semantic_score(correct: str, user: str, correct_emb=None) -> float:
     """
     Return a 0-10 semantic similarity score using sentence-transformers if available.
     Falls back to rapidfuzz token_set_ratio scaled to 0-10, else uses strict_score logic.
+    `correct_emb` is an optional precomputed (normalized) embedding of `correct`.
     """
     if not correct or not user:
         return 0.0
 
+    # trivial cases need no model: verbatim answer, or too short to carry any meaning
+    c_lo = correct.strip().lower()
+    u_lo = user.strip().lower()
+    trivial = _trivial_score(c_lo, u_lo)
+    if trivial is not None:
+        return trivial
+
     # Prefer sentence-transformers
     model = get_semantic_model()
     if model:
         try:
-            emb_c = model.encode(correct, convert_to_tensor=True)
-            emb_u = model.encode(user, convert_to_tensor=True)
-            sim = st_util.pytorch_cos_sim(emb_c, emb_u).item()  # -1..1
-            sim = max(0.0, sim)  # clamp negatives
-            # Map similarity to 0..10 (tuneable)
-            # sim ~ 0.0 -> 0, sim ~0.6 -> ~7, sim ~0.8 -> ~9
-            score = round(min(10.0, (sim ** 1.1) * 11.0), 1)
-            return score
+            key = _answer_key(correct)
+            cache = _answer_score_cache.get(key)
+            user_key = u_lo
+            # exact repeat of an already-scored answer: skip the encode entirely
+            if cache is not None:
+                cached = cache.get_text(user_key)
+                if cached is not None:
+                    return cached
+
+            # canonical answer never changes for a question -> encode it only once
+            emb_c = correct_emb
+            if emb_c is None:
+                emb_c = _answer_emb_cache.get(key)
+            if emb_c is None:
+                # miss: send the (correct, user) pair through the encoder in one batch
+                emb_c, emb_u = encode_normalized(model, [correct, user], batch_size=2)
+                _answer_emb_cache[key] = emb_c
+            else:
+                emb_u = encode_normalized(model, user)
+
+            return _score_embeddings(key, user_key, emb_c, emb_u)
         except Exception as e:
             logger.warning("semantic scoring failed: %s", e)
 
     # Fallback to rapidfuzz if available
-    if _have_rapidfuzz:
+    fuzz = get_fuzz()
+    if fuzz:
         try:
             ratio = fuzz.token_set_ratio(correct, user)  # 0..100
             score = round((ratio / 100.0) * 10.0, 1)
@@ -87,6 +254,11 @@ def semantic_score(correct: str, user: str) -> float:
     # We'll let the class's strict_score handle it (call externally).
     return None  # caller should handle None and call strict_score
 
+# opt-in (PREWARM=1): warm the model once per process, in the background, so the
+# first semantic score doesn't pay for it. Off by default to keep import fast and RAM low.
+if os.environ.get("PREWARM", "0") == "1":
+    threading.Thread(target=prewarm_semantic_model, daemon=True).start()
+
 class VoiceInterviewBot:
     def __init__(self, questions_per_session: int = 5):
         cfg = VoiceConfig()  # user config: device index, whisper model size etc
@@ -95,14 +267,38 @@ class VoiceInterviewBot:
                                   model_size=getattr(cfg, "model_size", "tiny"))
         self.model = EnhancedInterviewModel()
         self.questions_per_session = questions_per_session
+        # TTS runs on its own worker so speech overlaps with scoring / UI updates;
+        # listen() waits for the queue to drain so the mic opens as speech ends
+        self._tts_q = queue.Queue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
         self.reset_session()
 
+    def _tts_worker(self):
+        while True:
+            text = self._tts_q.get()
+            try:
+                self.audio.speak(text)
+            except Exception as e:
+                logger.warning("TTS failed: %s", e)
+            finally:
+                self._tts_q.task_done()
+
+    def say(self, text: str):
+        """Queue text for speech without blocking the interview generator."""
+        self._tts_q.put(text)
+
+    def listen(self, timeout: int):
+        """Wait for queued speech to finish, then record and transcribe."""
+        self._tts_q.join()
+        return self.audio.listen(timeout=timeout)
+
     def reset_session(self):
         self.role = None
         self.difficulty = None
         self.questions = []          # session question list (dicts)
         self.current_index = 0
         self.state = "idle"          # idle -> ask_role -> ask_difficulty -> ask_question -> summary
+        self.audio.reset_noise_profile()  # re-sample room noise for each session
 
         # NEW FLAGS for skip / stop functionality
         self.skip_flag = False
@@ -125,6 +321,23 @@ class VoiceInterviewBot:
         self.stop_flag = True
         return "### 🛑 Interview End Requested\n\nEnding interview and generating summary..."
 
+    # spoken phrase -> DB role key, in priority order (first listed role wins)
+    _ROLE_MAP = {
+        "backend": "backend developer", "back end": "backend developer",
+        "server": "backend developer", "api": "backend developer", "rest api": "backend developer",
+        "python": "python developer", " python developer": "python developer",
+        "data scientist": "data scientist", "data science": "data scientist",
+        "data analyst": "data analyst", "analytics": "data analyst",
+        "frontend": "frontend developer", "front end": "frontend developer",
+        "frontend developer": "frontend developer",
+        "software engineer": "software engineer", "software developer": "software engineer",
+        "devops engineer": "devops engineer", "dev ops": "devops engineer",
+        "site reliability": "devops engineer", "sre": "devops engineer",
+    }
+    _ROLE_PRIORITY = {role: i for i, role in enumerate(dict.fromkeys(_ROLE_MAP.values()))}
+    # single compiled alternation, longest phrases first
+    _ROLE_RE = re.compile("|".join(re.escape(p) for p in sorted(_ROLE_MAP, key=len, reverse=True)))
+
     # normalize many possible spoken role variations to DB role keys
     def normalize_role(self, spoken: str) -> str:
         if not spoken:
@@ -132,28 +345,10 @@ class VoiceInterviewBot:
 
         s = spoken.lower().strip()
 
-        backend_words = ["backend", "back end", "server", "api", "rest api"]
-        python_developer_words = ["python"," python developer"]
-        data_science_words = ["data scientist", "data science"]
-        data_analyst_words = ["data analyst", "analytics"]
-        frontend_developer_words = ["frontend", "front end","frontend developer"]
-        software_engineer_words = ["software engineer", "software developer"]
-        devops_engineer_words = ["devops engineer", "dev ops", "site reliability", "sre"]
-
-        if any(w in s for w in backend_words):
-            return "backend developer"
-        if any(w in s for w in python_developer_words):
-            return "python developer"
-        if any(w in s for w in data_science_words):
-            return "data scientist"
-        if any(w in s for w in data_analyst_words):
-            return "data analyst"
-        if any(w in s for w in frontend_developer_words):
-            return "frontend developer"
-        if any(w in s for w in software_engineer_words):
-            return "software engineer"
-        if any(w in s for w in devops_engineer_words):
-            return "devops engineer"
+        # one regex scan collects every phrase; the highest-priority role wins
+        roles = {self._ROLE_MAP[m.group(0)] for m in self._ROLE_RE.finditer(s)}
+        if roles:
+            return min(roles, key=self._ROLE_PRIORITY.__getitem__)
 
         return "backend developer"
 
@@ -193,6 +388,48 @@ class VoiceInterviewBot:
         # if overlap very small, treat as zero to be strict
         return score if score >= 6.0 else 0.0
 
+    def rescore_all(self) -> bool:
+        """
+        Replace the scores of all answered questions with semantic scores, in bulk.
+        This overrides the keyword scores from evaluate_answer; each answer gets the
+        same score semantic_score would give it (verbatim / too-short rules, answer
+        cache), but all remaining answers are encoded in a single batch.
+        Returns False if no semantic model is available.
+        """
+        model = get_semantic_model()
+        if not model:
+            return False
+        answered = [q for q in self.questions
+                    if q.get("user_answer") not in ("", "skipped", "unknown")]
+
+        # settle everything that needs no encode first
+        pending = []
+        for q in answered:
+            c_lo = q["correct_answer"].strip().lower()
+            u_lo = q["user_answer"].strip().lower()
+            key = _answer_key(q["correct_answer"])
+            score = _trivial_score(c_lo, u_lo)
+            if score is None and key in _answer_score_cache:
+                score = _answer_score_cache[key].get_text(u_lo)
+            if score is None:
+                pending.append((q, key, u_lo))
+            else:
+                q["score"] = score
+        if not pending:
+            return True
+
+        # canonical answers not yet in the embedding cache, deduplicated
+        missing = {key: q["correct_answer"] for q, key, _ in pending if key not in _answer_emb_cache}
+        if missing:
+            embs = encode_normalized(model, list(missing.values()), batch_size=len(missing))
+            _answer_emb_cache.update(zip(missing, embs))
+
+        user_embs = encode_normalized(model, [q["user_answer"] for q, _, _ in pending],
+                                      batch_size=len(pending))
+        for (q, key, u_lo), emb_u in zip(pending, user_embs):
+            q["score"] = _score_embeddings(key, u_lo, _answer_emb_cache[key], emb_u)
+        return True
+
     # generate summary Markdown (only for this session)
     def generate_summary_md(self) -> str:
         total = len(self.questions)
@@ -200,13 +437,20 @@ class VoiceInterviewBot:
             avg = 0.0
         else:
             avg = sum(q.get("score", 0.0) for q in self.questions) / total
-        md = f"## Interview Summary\n\n- Role: **{html.escape(str(self.role))}**\n- Difficulty: **{html.escape(str(self.difficulty))}**\n- Questions: **{total}**\n- Average Score: **{avg:.1f}/10**\n\n---\n\n"
+        parts = [
+            f"## Interview Summary\n\n- Role: **{self.role}**\n- Difficulty: **{self.difficulty}**\n"
+            f"- Questions: **{total}**\n- Average Score: **{avg:.1f}/10**\n\n---\n\n"
+        ]
         for i, q in enumerate(self.questions, 1):
-            md += f"### Q{i}: {html.escape(q.get('question',''))}\n\n"
-            md += f"**Your Answer:**  \n{html.escape(q.get('user_answer','unknown'))}\n\n"
-            md += f"**Correct Answer:**  \n{html.escape(q.get('correct_answer',''))}\n\n"
-            md += f"**Score:** {q.get('score',0.0)}/10\n\n---\n\n"
-        return md
+            parts.append(
+                f"### Q{i}: {q.get('question','')}\n\n"
+                f"**Your Answer:**  \n{q.get('user_answer','unknown')}\n\n"
+                f"**Correct Answer:**  \n{q.get('correct_answer','')}\n\n"
+                f"**Score:** {q.get('score',0.0)}/10\n\n---\n\n"
+            )
+        # the template itself contains no &<>"' so one escape over the joined
+        # document is equivalent to escaping every field separately
+        return html.escape("".join(parts))
 
     # The main generator: used by Gradio button .click(fn=bot.run_interview, ...)
     def run_interview(self):
@@ -222,31 +466,31 @@ class VoiceInterviewBot:
             # 1) Ask role
             # UI first, then speak (so UI updates instantly)
             yield " Listening for role..."
-            self.audio.speak("Which role would you like? For example: Python developer or Data Scientist.")
-            role_spoken = self.audio.listen(timeout=12)
+            self.say("Which role would you like? For example: Python developer or Data Scientist.")
+            role_spoken = self.listen(timeout=12)
             logger.info("Raw role (STT): %r", role_spoken)
 
             if not role_spoken:
-                self.audio.speak("I couldn't hear role. Defaulting to backend developer.")
+                self.say("I couldn't hear role. Defaulting to backend developer.")
                 self.role = "backend developer"
             else:
                 self.role = self.normalize_role(role_spoken)
             logger.info("Normalized role -> %s", self.role)
             yield f"Role selected: **{self.role}**"
-            self.audio.speak(f"You selected {self.role}. Now say easy, medium or hard for difficulty.")
+            self.say(f"You selected {self.role}. Now say easy, medium or hard for difficulty.")
 
             # 2) Ask difficulty
             yield " Listening for difficulty…"
-            diff_spoken = self.audio.listen(timeout=8)
+            diff_spoken = self.listen(timeout=8)
             logger.info("Raw difficulty (STT): %r", diff_spoken)
             if not diff_spoken:
-                self.audio.speak("I couldn't hear difficulty. Defaulting to easy.")
+                self.say("I couldn't hear difficulty. Defaulting to easy.")
                 self.difficulty = "easy"
             else:
                 self.difficulty = self.normalize_difficulty(diff_spoken)
             logger.info("Normalized difficulty -> %s", self.difficulty)
             yield f"Difficulty: **{self.difficulty}** — Starting interview…"
-            self.audio.speak(f"Difficulty set to {self.difficulty}. I will now ask {self.questions_per_session} questions.")
+            self.say(f"Difficulty set to {self.difficulty}. I will now ask {self.questions_per_session} questions.")
 
             # 3) Load questions from model DB — only current session
             try:
@@ -261,18 +505,10 @@ class VoiceInterviewBot:
                     self.questions = []
 
             if not self.questions:
-                self.audio.speak("I couldn't find questions for that role and difficulty. Please try another role or difficulty.")
+                self.say("I couldn't find questions for that role and difficulty. Please try another role or difficulty.")
                 yield " No questions found for your selection. Please restart and try a different role or difficulty."
                 return
 
-            # ensure each question has expected fields
-            for q in self.questions:
-                q.setdefault("question", "")
-                q.setdefault("answer", "")           # canonical/correct answer in DB (if present)
-                q.setdefault("user_answer", "")
-                q.setdefault("score", 0.0)
-                q.setdefault("correct_answer", q.get("answer", ""))
-
             # 4) Ask questions one by one
             for idx, q in enumerate(self.questions):
                 # END CHECK — if stop_flag set before processing this question, yield summary immediately
@@ -281,7 +517,7 @@ class VoiceInterviewBot:
                     # Since we're at start of this loop before asking idx, only previous questions were asked:
                     self.questions = self.questions[:idx]
                     summary_md = self.generate_summary_md()
-                    self.audio.speak("Interview ended. Generating summary.")
+                    self.say("Interview ended. Generating summary.")
                     yield summary_md
                     return
 
@@ -290,8 +526,7 @@ class VoiceInterviewBot:
                     self.skip_flag = False
                     q["user_answer"] = "skipped"
                     q["score"] = 0.0
-                    q["correct_answer"] = q.get("correct_answer", q.get("answer", ""))
-                    self.audio.speak(f"Question {idx+1} skipped.")
+                    self.say(f"Question {idx+1} skipped.")
                     yield f"Q{idx+1}: {q['question']}\n\nStatus: Skipped. Score: 0/10"
                     continue
 
@@ -299,17 +534,17 @@ class VoiceInterviewBot:
                 qtext = q["question"]
                 # ask — UI updates first, then TTS
                 yield f"Q{idx+1}: {qtext}\n\n Listening for your answer…"
-                self.audio.speak(f"Question {idx+1}. {qtext}")
+                self.say(f"Question {idx+1}. {qtext}")
 
                 # listen
-                answer = self.audio.listen(timeout=20)
+                answer = self.listen(timeout=20)
 
                 # If stop requested while listening (user clicked End Interview), handle immediately
                 if self.stop_flag:
                     # Keep questions up to and including the current one
                     #self.questions = self.questions[:idx+1]
                     summary_md = self.generate_summary_md()
-                    self.audio.speak("Interview ended. Generating summary.")
+                    self.say("Interview ended. Generating summary.")
                     yield summary_md
                     return
 
@@ -318,8 +553,7 @@ class VoiceInterviewBot:
                     self.skip_flag = False
                     q["user_answer"] = "skipped"
                     q["score"] = 0.0
-                    q["correct_answer"] = q.get("correct_answer", q.get("answer", ""))
-                    self.audio.speak("Question skipped.")
+                    self.say("Question skipped.")
                     yield f"Q{idx+1}: {qtext}\n\nStatus: Skipped. Score: 0/10"
                     continue
 
@@ -340,7 +574,6 @@ class VoiceInterviewBot:
 
                 # fallback semantic / fuzzy / strict scoring
                 if not scored:
-                    q["correct_answer"] = q.get("correct_answer", "")
                     # Try semantic_score
                     sscore = semantic_score(q["correct_answer"], q["user_answer"])
                     if sscore is None:
@@ -353,22 +586,22 @@ class VoiceInterviewBot:
                 feedback = f"Saved answer. Score: {q['score']}/10"
                 logger.info("Q%d stored - score %s", idx+1, q["score"])
                 yield f"Q{idx+1}: {qtext}\n\nYour Answer: {q['user_answer']}\n\nScore: {q['score']}/10"
-                self.audio.speak(feedback)
+                self.say(feedback)
 
             # 5) Summary
             summary_md = self.generate_summary_md()
             # show summary immediately, then speak average
             yield summary_md
-            self.audio.speak("The interview is complete. I will read out your average score.")
+            self.say("The interview is complete. I will read out your average score.")
             avg_score = 0.0
             if len(self.questions):
                 avg_score = sum(q.get("score",0) for q in self.questions)/len(self.questions)
-            self.audio.speak(f"Your average score is {avg_score:.1f} out of 10.")
+            self.say(f"Your average score is {avg_score:.1f} out of 10.")
             return
 
         except Exception as ex:
             logger.exception("Error during interview run: %s", ex)
-            self.audio.speak("An error occurred during the interview. Please check the application logs.")
+            self.say("An error occurred during the interview. Please check the application logs.")
             yield " An unexpected error occurred. See console for details."
 
 # ----------------------------
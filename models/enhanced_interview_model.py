@@ -1,8 +1,23 @@
+import copy
 import json
 import random
 import logging
 import os
 
+# Optional: orjson parses JSON lines several times faster than stdlib json.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
+# Optional: pyahocorasick matches all answer keywords in a single pass.
+try:
+    import ahocorasick
+    _have_ahocorasick = True
+except Exception:
+    _have_ahocorasick = False
+
 logger = logging.getLogger(__name__)
 
 class EnhancedInterviewModel:
@@ -10,11 +25,13 @@ class EnhancedInterviewModel:
     Loads database.jsonl and provides:
       - get_questions(role, difficulty, limit)
       - evaluate_answer(question_dict, user_answer)
+      - get_actual_correct_answer(_batch)(question(s)) for verify_answers.py
     """
 
     def __init__(self, db_path="database.jsonl"):
         self.db_path = db_path
         self.db = []          # <-- FIXED (was missing)
+        self._index = {}      # (role, difficulty) -> [question dicts]
 
         if not os.path.exists(self.db_path):
             logger.error("Database file not found: %s", self.db_path)
@@ -25,22 +42,54 @@ class EnhancedInterviewModel:
     def _load_db(self):
         """Load JSONL database into memory"""
         try:
-            with open(self.db_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # skip empty or comments
-                    if not line or line.startswith("#"):
-                        continue
-                    try:
-                        item = json.loads(line)
-                        self.db.append(item)
-                    except json.JSONDecodeError:
-                        logger.warning("Invalid JSON skipped: %s", line)
+            # read the whole file in one go and parse raw bytes
+            with open(self.db_path, "rb") as f:
+                data = f.read()
+            for line in data.split(b"\n"):
+                line = line.strip()
+                # skip empty or comments
+                if not line or line[:1] == b"#":
+                    continue
+                try:
+                    item = _json_loads(line)
+                except ValueError:
+                    logger.warning("Invalid JSON skipped: %s", line.decode("utf-8", "replace"))
+                    continue
+                # fixed session schema, so run_interview needs no per-question setup
+                item.setdefault("question", "")
+                item.setdefault("answer", "")
+                item["user_answer"] = ""
+                item["score"] = 0.0
+                item["correct_answer"] = item.get("correct_answer") or item["answer"]
+                self.db.append(item)
+                # DB is immutable after load: normalise lookup keys and keywords once
+                item["_role_lc"] = item.get("role", "").lower().strip()
+                item["_diff_lc"] = item.get("difficulty", "").lower().strip()
+                item["_answer_keywords"] = self._keywords(item.get("answer", ""))
+                item["_ac"] = self._build_automaton(item["_answer_keywords"])
+                self._index.setdefault((item["_role_lc"], item["_diff_lc"]), []).append(item)
         except Exception as e:
             logger.exception("Failed loading DB: %s", e)
 
         logger.info("Loaded %d questions from DB.", len(self.db))
 
+    @staticmethod
+    def _keywords(answer):
+        """First five long (>5 chars) lowercase words of an answer."""
+        return tuple(w for w in answer.lower().split() if len(w) > 5)[:5]
+
+    @staticmethod
+    def _build_automaton(keywords):
+        """Aho-Corasick automaton over the keywords (None if unavailable)."""
+        if not _have_ahocorasick or not keywords:
+            return None
+        A = ahocorasick.Automaton()
+        # value keeps the multiplicity so repeated keywords still score per occurrence
+        for kw in set(keywords):
+            A.add_word(kw, (kw, keywords.count(kw)))
+        A.make_automaton()
+        return A
+
     # ---------------------------------------------------------------------
 
     def get_questions(self, role, difficulty, limit=5):
@@ -55,20 +104,41 @@ class EnhancedInterviewModel:
 
         logger.info("Filtering DB: role=%s difficulty=%s", role, difficulty)
 
-        # Filter
-        filtered = [
-            q for q in self.db
-            if q.get("role","").lower() == role
-               and q.get("difficulty","").lower() == difficulty
-        ]
+        # Lookup in the (role, difficulty) index built at load time
+        filtered = self._index.get((role, difficulty), [])
 
         logger.info("Found %d matching questions.", len(filtered))
 
         if not filtered:
             return []
 
-        random.shuffle(filtered)
-        return filtered[:limit]
+        # O(limit) sample rather than shuffling the whole bucket; clamp so a
+        # non-positive limit yields [] instead of a ValueError from random.sample
+        k = max(0, min(limit, len(filtered)))
+        # shallow copies: sessions write user_answer/score without touching the DB
+        return [copy.copy(q) for q in random.sample(filtered, k)]
+
+    # ---------------------------------------------------------------------
+
+    @property
+    def questions(self):
+        """All loaded question dicts (the DB itself, not copies)."""
+        return self.db
+
+    def get_roles(self):
+        return sorted({role for role, _ in self._index})
+
+    def get_difficulties(self):
+        return sorted({diff for _, diff in self._index})
+
+    def get_actual_correct_answer(self, question_dict):
+        """Canonical answer stored on this question's own DB row ("" if none).
+        Not looked up by text: some question texts repeat with different answers."""
+        return question_dict.get("ideal_answer") or question_dict.get("answer", "")
+
+    def get_actual_correct_answer_batch(self, question_dicts):
+        """get_actual_correct_answer for many questions in one call."""
+        return [q.get("ideal_answer") or q.get("answer", "") for q in question_dicts]
 
     # ---------------------------------------------------------------------
 
@@ -87,11 +157,19 @@ class EnhancedInterviewModel:
 
         # cheap keyword scoring
         score = 0
-        keywords = [w for w in correct.split() if len(w) > 5][:5]
-
-        for kw in keywords:
-            if kw in user:
-                score += 2
+        keywords = question_dict.get("_answer_keywords")
+        if keywords is None:
+            keywords = self._keywords(correct)
+
+        automaton = question_dict.get("_ac")
+        if automaton is not None:
+            # one pass over the answer; count each matched keyword once
+            matched = {value for _, value in automaton.iter(user)}
+            score = 2 * sum(count for _, count in matched)
+        else:
+            for kw in keywords:
+                if kw in user:
+                    score += 2
 
         # clamp 0–10
         score = max(0, min(score, 10))
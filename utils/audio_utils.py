@@ -1,9 +1,6 @@
 import speech_recognition as sr
 import whisper
-import tempfile
-import os
 import numpy as np
-import soundfile as sf
 
 # Optional: try to import noisereduce, but keep functionality even if it's missing.
 try:
@@ -12,16 +9,82 @@ try:
 except Exception:
     _have_noisereduce = False
 
+# Optional: faster-whisper (CTranslate2) runs the same Whisper weights quantized to int8.
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    _have_faster_whisper = True
+except Exception:
+    _have_faster_whisper = False
+
+# Process-wide singletons: Whisper weights per model size, and one TTS engine.
+_WHISPER_CACHE = {}
+_TTS_ENGINE = None
+
+def _load_whisper(model_size):
+    model = _WHISPER_CACHE.get(model_size)
+    if model is None:
+        print("🎙 Loading Whisper model:", model_size)
+        model = None
+        if _have_faster_whisper:
+            try:
+                on_gpu = ctranslate2.get_cuda_device_count() > 0
+                model = WhisperModel(model_size, device="cuda" if on_gpu else "cpu",
+                                     compute_type="int8_float16" if on_gpu else "int8")
+            except Exception as e:
+                print("⚠️ faster-whisper unavailable, using openai-whisper:", e)
+        if model is None:
+            model = whisper.load_model(model_size)
+        _WHISPER_CACHE[model_size] = model
+    return model
+
 class AudioHandler:
     def __init__(self, device_index=1, model_size="small"):
-        print("🎙 Loading Whisper model:", model_size)
         try:
-            self.model = whisper.load_model(model_size)
+            self.model = _load_whisper(model_size)
         except Exception as e:
             print("❌ Could not load requested whisper model, falling back to 'tiny':", e)
-            self.model = whisper.load_model("tiny")
+            self.model = _load_whisper("tiny")
         self.recognizer = sr.Recognizer()
         self.device_index = device_index
+        self._noise_clip = None   # last quiet calibration window, the noisereduce profile
+
+    def reset_noise_profile(self):
+        """Forget the noise profile (new session: the room may have changed)."""
+        self._noise_clip = None
+
+    @staticmethod
+    def _to_float32(audio):
+        """AudioData -> 16 kHz mono float32 in [-1, 1] (speech_recognition does the resampling)."""
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def _calibrate(self, source, duration, max_peak_ratio=3.0):
+        """
+        Same energy-threshold update as Recognizer.adjust_for_ambient_noise(), but keeps
+        the calibration audio. Returns it as a noise profile (16 kHz float32), or None if
+        the window doesn't look like stationary noise (e.g. the user already started talking).
+        """
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** seconds_per_buffer
+        frames, energies = [], []
+        elapsed_time = seconds_per_buffer
+        while elapsed_time <= duration:
+            buffer = source.stream.read(source.CHUNK)
+            # Microphone always records 16-bit PCM
+            energy = float(np.sqrt(np.mean(np.square(np.frombuffer(buffer, dtype=np.int16), dtype=np.float64))))
+            target_energy = energy * self.recognizer.dynamic_energy_ratio
+            self.recognizer.energy_threshold = (self.recognizer.energy_threshold * damping
+                                                + target_energy * (1 - damping))
+            frames.append(buffer)
+            energies.append(energy)
+            elapsed_time += seconds_per_buffer
+
+        # speech shows up as a few buffers far louder than the rest
+        if not energies or max(energies) > max_peak_ratio * max(np.median(energies), 1.0):
+            return None
+        noise = sr.AudioData(b"".join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+        return self._to_float32(noise)
 
     def listen(self, timeout=12, phrase_time_limit=30, calibrate_seconds=1.2):
         """
@@ -31,8 +94,11 @@ class AudioHandler:
         try:
             with sr.Microphone(device_index=self.device_index) as source:
                 print("🎤 Listening...")
-                # longer ambient calibration
-                self.recognizer.adjust_for_ambient_noise(source, duration=calibrate_seconds)
+                # longer ambient calibration; its audio doubles as the noise profile,
+                # so there is no separate noise recording
+                noise = self._calibrate(source, calibrate_seconds)
+                if noise is not None:
+                    self._noise_clip = noise
                 audio = self.recognizer.listen(
                     source,
                     timeout=timeout,
@@ -42,73 +108,55 @@ class AudioHandler:
             print("❌ Listen error:", e)
             return ""
 
-        # Save WAV temp
-        wav_path = None
-        reduced_wav = None
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-                tmp.write(audio.get_wav_data())
-                wav_path = tmp.name
-
-            # Load wav with soundfile
-            audio_data, sr_ = sf.read(wav_path)
-
-            # If stereo, convert to mono
-            if audio_data.ndim > 1:
-                audio_data = np.mean(audio_data, axis=1)
+            # handed to Whisper as a float32 array: no temp WAVs, no ffmpeg decode
+            audio_data = self._to_float32(audio)
 
             # Optional noise reduction
             if _have_noisereduce:
                 try:
-                    reduced = nr.reduce_noise(y=audio_data.astype(np.float32), sr=sr_)
+                    if self._noise_clip is not None:
+                        # profile from the latest quiet calibration: no per-answer noise estimation
+                        reduced = nr.reduce_noise(y=audio_data, sr=16000, y_noise=self._noise_clip,
+                                                  stationary=True, n_fft=1024)
+                    else:
+                        reduced = nr.reduce_noise(y=audio_data, sr=16000)
+                    audio_data = reduced.astype(np.float32, copy=False)
                 except Exception as e:
                     print("⚠️ noisereduce failed:", e)
-                    reduced = audio_data
-            else:
-                reduced = audio_data
-
-            # write reduced to a new temp file for whisper
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp2:
-                sf.write(tmp2.name, reduced, sr_)
-                reduced_wav = tmp2.name
 
             # Whisper transcription (use language='en' to prefer English)
             print("🧠 Whisper transcribing…")
             try:
-                result = self.model.transcribe(reduced_wav, language='en', temperature=0.0)
-                text = result.get('text', '').strip().lower()
+                text = self._transcribe(audio_data).strip().lower()
             except Exception as e:
                 print("❌ Whisper transcribe failed:", e)
                 text = ""
 
-            # cleanup temp files
-            try:
-                os.remove(wav_path)
-            except Exception:
-                pass
-            try:
-                if reduced_wav and os.path.exists(reduced_wav):
-                    os.remove(reduced_wav)
-            except Exception:
-                pass
-
             return text
 
         except Exception as e:
             print("❌ Whisper error:", e)
-            # cleanup
-            if wav_path and os.path.exists(wav_path):
-                try: os.remove(wav_path)
-                except Exception: pass
-            if reduced_wav and os.path.exists(reduced_wav):
-                try: os.remove(reduced_wav)
-                except Exception: pass
             return ""
 
+    def _transcribe(self, audio_data):
+        """Transcribe 16 kHz float32 audio with whichever Whisper backend is loaded."""
+        if _have_faster_whisper and isinstance(self.model, WhisperModel):
+            segments, _ = self.model.transcribe(audio_data, language='en', temperature=0.0,
+                                                beam_size=1, vad_filter=True)
+            # segment texts carry their own leading space
+            return "".join(seg.text for seg in segments)
+        # fp16 only helps (and is only supported) on GPU
+        result = self.model.transcribe(audio_data, language='en', temperature=0.0,
+                                       fp16=self.model.device.type == "cuda")
+        return result.get('text', '')
+
     def speak(self, text):
-        """Simple TTS via pyttsx3"""
-        import pyttsx3
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 165)
-        engine.say(text)
-        engine.runAndWait()
+        """Simple TTS via pyttsx3 (engine initialised once per process)"""
+        global _TTS_ENGINE
+        if _TTS_ENGINE is None:
+            import pyttsx3
+            _TTS_ENGINE = pyttsx3.init()
+            _TTS_ENGINE.setProperty('rate', 165)
+        _TTS_ENGINE.say(text)
+        _TTS_ENGINE.runAndWait()
@@ -5,35 +5,37 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
 import io
 import datetime
-import tempfile
 import os
 
 class EvaluationReport:
     def __init__(self, session_data):
         self.session_data = session_data
+        # digest the session once; both text and PDF reports read these
+        self._questions = self.session_data.get('questions', [])
+        self._stats = self.calculate_overall_stats()
     
     def calculate_overall_stats(self):
-        questions = self.session_data.get('questions', [])
+        questions = self._questions
         if not questions:
             return self.get_empty_stats()
         
-        scores = [q.get('evaluation', {}).get('score', 0) for q in questions]
-        categories = {}
-        
-        for q in questions:
-            cat = q.get('category', 'general')
-            if cat not in categories:
-                categories[cat] = []
-            eval_data = q.get('evaluation', {})
-            categories[cat].append(eval_data.get('score', 0))
-        
-        category_scores = {cat: np.mean(scores) if scores else 0 for cat, scores in categories.items()}
+        # one pass to flat arrays, then per-category means via bincount
+        n = len(questions)
+        scores = np.fromiter(((q.get('evaluation') or {}).get('score', 0) for q in questions),
+                             dtype=np.float32, count=n)
+        # category -> dense id in order of first appearance (any hashable, e.g. None)
+        ids = {}
+        inv = np.fromiter((ids.setdefault(q.get('category', 'general'), len(ids)) for q in questions),
+                          dtype=np.intp, count=n)
+        means = np.bincount(inv, weights=scores) / np.bincount(inv)
+        category_scores = {cat: float(means[k]) for cat, k in ids.items()}
+        overall = float(scores.mean())
         
         return {
-            'overall_score': np.mean(scores) if scores else 0,
-            'total_questions': len(scores),
+            'overall_score': overall,
+            'total_questions': n,
             'category_scores': category_scores,
-            'performance_level': self.get_performance_level(np.mean(scores) if scores else 0),
+            'performance_level': self.get_performance_level(overall),
             'duration': self.session_data.get('end_time', 0) - self.session_data.get('start_time', 0)
         }
     
@@ -57,9 +59,9 @@ class EvaluationReport:
             return "Needs Improvement"
     
     def generate_report_text(self):
-        stats = self.calculate_overall_stats()
+        stats = self._stats
         
-        report = f"""
+        parts = [f"""
 INTERVIEW PERFORMANCE REPORT
 ============================
 
@@ -72,36 +74,36 @@ Total Questions: {stats['total_questions']}
 Session Duration: {self.format_duration(stats['duration'])}
 
 Category-wise Performance:
-"""
+"""]
         
         for category, score in stats['category_scores'].items():
-            report += f"\n{category.title()}: {score:.2f}/10"
+            parts.append(f"\n{category.title()}: {score:.2f}/10")
         
-        report += "\n\nDetailed Analysis:\n"
+        parts.append("\n\nDetailed Analysis:\n")
         
-        for i, q_data in enumerate(self.session_data.get('questions', []), 1):
-            eval_data = q_data.get('evaluation', {})
-            report += f"\n{i}. {q_data.get('question', 'N/A')}"
-            report += f"\n   Your Answer: {q_data.get('user_answer', 'No answer provided')}"
-            report += f"\n   Score: {eval_data.get('score', 'N/A')}/10"
-            report += f"\n   Keywords Matched: {len(eval_data.get('matched_keywords', []))}/{len(eval_data.get('matched_keywords', []) + eval_data.get('missing_keywords', []))}"
-            
+        for i, q_data in enumerate(self._questions, 1):
+            eval_data = q_data.get('evaluation') or {}
             matched = eval_data.get('matched_keywords', [])
+            missing = eval_data.get('missing_keywords', [])
+            parts.append(f"\n{i}. {q_data.get('question', 'N/A')}")
+            parts.append(f"\n   Your Answer: {q_data.get('user_answer', 'No answer provided')}")
+            parts.append(f"\n   Score: {eval_data.get('score', 'N/A')}/10")
+            parts.append(f"\n   Keywords Matched: {len(matched)}/{len(matched) + len(missing)}")
+            
             if matched:
-                report += f"\n   Matched Keywords: {', '.join(matched)}"
+                parts.append(f"\n   Matched Keywords: {', '.join(matched)}")
             
-            missing = eval_data.get('missing_keywords', [])
             if missing:
-                report += f"\n   Missing Keywords: {', '.join(missing)}"
+                parts.append(f"\n   Missing Keywords: {', '.join(missing)}")
             
             # Add ideal answer to report - get from evaluation data first, then question data
             ideal_answer = eval_data.get('ideal_answer', q_data.get('ideal_answer', ''))
             if ideal_answer:
-                report += f"\n   Model Answer: {ideal_answer}"
+                parts.append(f"\n   Model Answer: {ideal_answer}")
             
-            report += "\n"
+            parts.append("\n")
         
-        return report
+        return "".join(parts)
     
     def format_duration(self, seconds):
         """Format duration in seconds to readable string"""
@@ -113,11 +115,9 @@ Category-wise Performance:
     
     def generate_pdf_report(self, filename):
         """Generate PDF report with proper file handling"""
+        # build next to the target, then atomically swap it in (no cross-device copy)
+        temp_filename = filename + '.partial'
         try:
-            # Create a temporary file first
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                temp_filename = tmp_file.name
-            
             doc = SimpleDocTemplate(temp_filename, pagesize=letter)
             styles = getSampleStyleSheet()
             story = []
@@ -136,7 +136,7 @@ Category-wise Performance:
             story.append(Spacer(1, 12))
             
             # Overall stats
-            stats = self.calculate_overall_stats()
+            stats = self._stats
             overall_text = f"""
             Overall Score: {stats['overall_score']:.2f}/10<br/>
             Performance Level: {stats['performance_level']}<br/>
@@ -149,31 +149,32 @@ Category-wise Performance:
             # Questions analysis
             story.append(Paragraph("Detailed Question Analysis", styles['Heading2']))
             
-            for i, q_data in enumerate(self.session_data.get('questions', []), 1):
-                eval_data = q_data.get('evaluation', {})
-                
-                q_text = Paragraph(f"<b>Q{i}: {q_data.get('question', 'N/A')}</b>", styles['Normal'])
-                story.append(q_text)
-                
-                ans_text = Paragraph(f"<b>Your Answer:</b> {q_data.get('user_answer', 'No answer')}", styles['Normal'])
-                story.append(ans_text)
-                
-                score_text = Paragraph(f"<b>Score:</b> {eval_data.get('score', 'N/A')}/10", styles['Normal'])
-                story.append(score_text)
-                
+            # all questions in one table: a single layout pass instead of ~5 flowables per question
+            normal = styles['Normal']
+            rows = [['Q', 'Question', 'Your Answer', 'Score', 'Model Answer']]
+            for i, q_data in enumerate(self._questions, 1):
+                eval_data = q_data.get('evaluation') or {}
                 # Add ideal answer - get from evaluation data first, then question data
                 ideal_answer = eval_data.get('ideal_answer', q_data.get('ideal_answer', ''))
-                if ideal_answer:
-                    ideal_text = Paragraph(f"<b>Model Answer:</b> {ideal_answer}", styles['Normal'])
-                    story.append(ideal_text)
-                
-                story.append(Spacer(1, 12))
+                # Paragraph only for the long cells that need wrapping
+                rows.append([
+                    str(i),
+                    Paragraph(q_data.get('question', 'N/A'), normal),
+                    Paragraph(q_data.get('user_answer', 'No answer'), normal),
+                    f"{eval_data.get('score', 'N/A')}/10",
+                    Paragraph(ideal_answer, normal) if ideal_answer else '',
+                ])
+            
+            story.append(Table(rows, colWidths=[24, 130, 130, 44, 140], repeatRows=1, style=TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ])))
             
             doc.build(story)
             
-            # Move the temporary file to the final destination
-            import shutil
-            shutil.move(temp_filename, filename)
+            os.replace(temp_filename, filename)
             return True
             
         except Exception as e:
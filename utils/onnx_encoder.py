@@ -0,0 +1,62 @@
+"""
+ONNX Runtime backend for all-MiniLM-L6-v2 (dynamic int8 quantization, CPU).
+
+Exposes the small subset of SentenceTransformer.encode() that app.py uses, so it
+can be swapped in for the PyTorch model on CPU-only hosts.
+Requires `optimum[onnxruntime]`; callers should fall back to sentence-transformers
+when it is missing.
+"""
+import os
+import numpy as np
+
+MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+QUANTIZED_FILE = "model_quantized.onnx"
+
+
+class OnnxSentenceEncoder:
+    """Tokenizer + ORT model + mean pooling, mirroring the MiniLM sentence-transformers pipeline."""
+
+    def __init__(self, model, tokenizer, max_seq_length=256):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        out = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start:start + batch_size]
+            enc = self.tokenizer(batch, padding=True, truncation=True,
+                                 max_length=self.max_seq_length, return_tensors="np")
+            hidden = self.model(**enc).last_hidden_state
+            # mean pooling over non-padding tokens
+            mask = enc["attention_mask"][..., None].astype(np.float32)
+            emb = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out.append(emb.astype(np.float32, copy=False))
+
+        embs = np.concatenate(out) if out else np.empty((0, 384), dtype=np.float32)
+        if normalize_embeddings:
+            embs /= np.clip(np.linalg.norm(embs, axis=1, keepdims=True), 1e-12, None)
+        return embs[0] if single else embs
+
+
+def load_quantized_minilm(cache_dir):
+    """Export + int8-quantize MiniLM on first use (cached in `cache_dir`) and load it."""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    out_dir = os.path.join(cache_dir, "all-MiniLM-L6-v2-onnx-int8")
+    if not os.path.exists(os.path.join(out_dir, QUANTIZED_FILE)):
+        fp32_model = ORTModelForFeatureExtraction.from_pretrained(MODEL_ID, export=True)
+        quantizer = ORTQuantizer.from_pretrained(fp32_model)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=out_dir, quantization_config=qconfig)
+        AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(out_dir)
+
+    model = ORTModelForFeatureExtraction.from_pretrained(out_dir, file_name=QUANTIZED_FILE)
+    tokenizer = AutoTokenizer.from_pretrained(out_dir)
+    return OnnxSentenceEncoder(model, tokenizer)
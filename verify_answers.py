@@ -22,8 +22,10 @@ def verify_database_answers(db_path=DB_PATH, sample_limit=20):
         print("No questions loaded.")
         return
 
-    # sample some questions (first N)
-    for i, question in enumerate(model.questions[:sample_limit]):
+    # sample some questions (first N); fetch all their answers in one batch call
+    sample = model.questions[:sample_limit]
+    fetched_answers = model.get_actual_correct_answer_batch(sample)
+    for i, (question, fetched) in enumerate(zip(sample, fetched_answers)):
         print(f"\n{i+1}. ROLE: {question.get('role','Any')} | DIFFICULTY: {question.get('difficulty','Any')}")
         print(f"   QUESTION: {question['question']}")
         stored_answer = question.get('ideal_answer', '')
@@ -32,7 +34,6 @@ def verify_database_answers(db_path=DB_PATH, sample_limit=20):
         else:
             print(f"   STORED: {stored_answer[:150]}{'...' if len(stored_answer) > 150 else ''}")
 
-        fetched = model.get_actual_correct_answer(question)
         print(f"   FETCHED: {fetched[:150]}{'...' if len(fetched) > 150 else ''}")
 
         # report generic / missing